@@ -0,0 +1,92 @@
+# Author: Dongli Liu
+# Description: A benchmark of the canvas and raster backends of DynamicChart.
+
+import sys
+import time
+
+from tkinter import Tk, TclError
+
+from dynamic_chart import DynamicChart
+from raster_chart import RasterChart
+
+WIDTHS = [100, 1000, 10000]  # number of bars in the chart
+AMPLIFY = 2  # pixels per bar, small enough for 10k bars to fit a buffer
+FRAMES = 20
+
+
+def timeit(func, frames=FRAMES):
+    """Return the mean seconds per call of func over a number of frames."""
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(frames):
+        func()
+    return (time.perf_counter() - start) / frames
+
+
+def benchRaster(width):
+    """
+    Time a full and a scrolled frame of a chart built without widgets.
+
+    Both frames include encoding the whole buffer for the blit, which costs
+    the same however many columns were rendered; it is also timed alone.
+    """
+    chart = DynamicChart.__new__(DynamicChart)  # layout only, no widgets
+    chart.width, chart.amplify, chart.margin, chart.base = width, AMPLIFY, 30, 340
+    chart.c_data = DynamicChart.CircularList(DynamicChart.DATA)
+    chart.col_range = [[255, 113, 205], [87, 85, 254]]
+    chart.raster = RasterChart(width * AMPLIFY + 2 * chart.margin, chart.base + 20)
+    chart._rendered_range = None
+
+    def roll():
+        chart.box = chart.c_data.roll(width)
+        chart.locs = chart.getLocations()
+
+    def full():
+        roll()
+        chart.renderRaster(line=True)
+        chart.raster.ppm()
+
+    def scroll():
+        roll()
+        chart.scrollRaster()
+        chart.raster.ppm()
+
+    return timeit(full), timeit(scroll), timeit(chart.raster.ppm)
+
+
+def benchFrame(root, width, backend):
+    """Time a whole frame of a chart on screen, including Tk drawing."""
+    chart = DynamicChart(width=width, amplify=AMPLIFY, backend=backend)
+
+    def frame():
+        chart.nextFrame()
+        root.update()
+
+    seconds = timeit(frame)
+    chart.destroy()
+    return seconds
+
+
+if __name__ == "__main__":
+    print(
+        f"{'bars':>6} {'raster full':>12} {'raster scroll':>14}"
+        f" {'of which blit':>14}"
+    )
+    for width in WIDTHS:
+        full, scroll, blit = benchRaster(width)
+        print(
+            f"{width:>6} {full * 1e3:>10.2f}ms {scroll * 1e3:>12.2f}ms"
+            f" {blit * 1e3:>12.2f}ms"
+        )
+
+    try:
+        root = Tk()
+    except TclError as e:
+        print(f"\nSkipping the canvas comparison, it needs a display: {e}")
+        sys.exit()
+    print(f"\n{'bars':>6} {'canvas frame':>13} {'raster frame':>13}")
+    for width in WIDTHS:
+        canvas = benchFrame(root, width, "canvas")
+        raster = benchFrame(root, width, "raster")
+        print(f"{width:>6} {canvas * 1e3:>11.2f}ms {raster * 1e3:>11.2f}ms")
+    root.destroy()
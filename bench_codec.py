@@ -0,0 +1,78 @@
+# Author: Dongli Liu
+# Description: A benchmark of the frame codec against the raw JSON payloads.
+
+import time
+
+from json import dumps, loads
+from time import asctime
+
+import numpy as np
+
+from channels import REGISTRY
+from codec import FrameCodec
+from data_generator import VoiceDataGenerator
+
+FRAME_SIZES = [1, 10, 100]
+STEPS = [0.1, 1.0]
+REPEAT = 5
+
+
+def frames(samples, size):
+    """Split the samples into frames of a size."""
+    return [samples[i : i + size] for i in range(0, len(samples), size)]
+
+
+def timeit(func):
+    """Return the best seconds of a number of calls of func."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchJSON(samples):
+    """Measure the payloads sent today, one JSON message per sample."""
+    payloads = [dumps({asctime(): v}) for v in samples.tolist()]
+    size = sum(len(p.encode("utf-8")) for p in payloads)
+    encode = timeit(lambda: [dumps({asctime(): v}) for v in samples.tolist()])
+    decode = timeit(lambda: [list(loads(p).values()) for p in payloads])
+    return size, encode, decode, 0.0
+
+
+def benchCodec(samples, size, step):
+    """Measure the frame codec with a frame size and a quantization step."""
+    codec = FrameCodec(step=step)
+    chunks = frames(samples, size)
+    payloads = [codec.encode(c) for c in chunks]
+    decoded = np.concatenate([FrameCodec.decode(p) for p in payloads])
+    error = np.abs(decoded - samples).max()
+    encode = timeit(lambda: [codec.encode(c) for c in chunks])
+    decode = timeit(lambda: [FrameCodec.decode(p) for p in payloads])
+    return sum(len(p) for p in payloads), encode, decode, error
+
+
+def report(name, samples, size, encode, decode, error):
+    """Print a row of the results."""
+    n = len(samples)
+    print(
+        f"{name:<22} {size / n:>10.2f} {n / encode / 1e3:>12.1f}"
+        f" {n / decode / 1e3:>12.1f} {error:>10.3f}"
+    )
+
+
+if __name__ == "__main__":
+    samples = np.concatenate(
+        [VoiceDataGenerator(*c.metrics).data[:, 1] for c in REGISTRY]
+    )
+    print(f"{len(samples)} samples from {len(REGISTRY)} channels")
+    print(
+        f"{'payload':<22} {'bytes/smpl':>10} {'enc ksmpl/s':>12}"
+        f" {'dec ksmpl/s':>12} {'max error':>10}"
+    )
+    report("json, 1 per message", samples, *benchJSON(samples))
+    for step in STEPS:
+        for size in FRAME_SIZES:
+            name = f"codec, step {step}, {size}"
+            report(name, samples, *benchCodec(samples, size, step))
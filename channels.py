@@ -0,0 +1,162 @@
+# Author: Dongli Liu
+# Description: A registry of the radio channels loaded from a config file.
+
+from json import load
+
+from util import CONFIG
+
+# types of the VoiceDataGenerator arguments given as a channel's metrics
+METRIC_TYPES = (int, str, (int, float), (int, float), (int, float), bool)
+
+
+class Channel:
+    """
+    A compact record of a radio channel.
+
+    Attributes:
+        index (int): The position of the channel in the registry.
+        name (str): The channel name, also used as the MQTT topic.
+        metrics (tuple): The parameters for creating the data generator.
+        colors (list): The color range of the channel in charts.
+    """
+
+    __slots__ = ("index", "name", "metrics", "colors")
+
+    def __init__(self, index, name, metrics, colors) -> None:
+        """Initialize the Channel."""
+        self.index = index
+        self.name = name
+        self.metrics = tuple(metrics)
+        self.colors = colors
+
+
+class ChannelRegistry:
+    """
+    A class holding the channels configured in a JSON file.
+
+    The file has a "channels" list of objects with a "name" and optionally
+    "metrics" and "colors", falling back to the "defaults" object. Every
+    entry is checked while loading, so mistakes are reported up front. Only
+    the records are built when loading; generators and buffers are left to
+    the users of a channel, to be created the first time it is used.
+
+    Attributes:
+        channels (list): The Channel records in config order.
+        indexes (dict): The index of each channel by name.
+    """
+
+    def __init__(self, path=CONFIG) -> None:
+        """
+        Initialize the ChannelRegistry.
+
+        Args:
+            path (str): The path of the JSON config file.
+        """
+        with open(path, encoding="utf-8") as f:
+            config = load(f)
+        defaults = config.get("defaults", {})
+        entries = config.get("channels")
+        if not isinstance(entries, list) or not entries:
+            raise ValueError(f"{path} configures no channels.")
+        self.channels = []
+        self.indexes = {}
+        for i, entry in enumerate(entries):
+            channel = self.record(i, entry, defaults)
+            self.channels.append(channel)
+            self.indexes[channel.name] = i
+
+    def record(self, index, entry, defaults):
+        """
+        Build the record of a config entry, checking it on the way.
+
+        Args:
+            index (int): The position of the entry in the config.
+            entry (dict): The config entry of the channel.
+            defaults (dict): The values used when the entry leaves them out.
+
+        Returns:
+            Channel: The record of the channel.
+
+        Raises:
+            ValueError: If the entry is incomplete or malformed.
+        """
+        name = entry.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Channel {index} has no name.")
+        if name in self.indexes:
+            raise ValueError(f"Channel {name} is configured twice.")
+        metrics = entry.get("metrics", defaults.get("metrics"))
+        if not (
+            isinstance(metrics, list)
+            and 0 < len(metrics) <= len(METRIC_TYPES)
+            and all(
+                isinstance(m, t) and (t is bool or not isinstance(m, bool))
+                for m, t in zip(metrics, METRIC_TYPES)
+            )
+            and metrics[0] > 0
+        ):
+            raise ValueError(
+                f"Channel {name} needs metrics, a list of [duration, gender, noise,"
+                " tune_pitch, tune_pitch_sd, broadcast] with at least the duration."
+            )
+        colors = entry.get("colors", defaults.get("colors"))
+        if not (
+            isinstance(colors, list)
+            and len(colors) == 2
+            and all(
+                isinstance(c, list)
+                and len(c) == 3
+                and all(isinstance(v, int) and 0 <= v <= 255 for v in c)
+                for c in colors
+            )
+        ):
+            raise ValueError(
+                f"Channel {name} needs colors, two RGB lists of 0 to 255."
+            )
+        return Channel(index, name, metrics, colors)
+
+    def __len__(self):
+        """Return the number of channels."""
+        return len(self.channels)
+
+    def __getitem__(self, index):
+        """Return the channel at an index."""
+        return self.channels[index]
+
+    def pages(self, size):
+        """Return the number of pages of a given size."""
+        return max(1, -(-len(self.channels) // size))
+
+    def page(self, number, size):
+        """
+        Return the channels on a page.
+
+        Args:
+            number (int): The page number, starting from 0.
+            size (int): The number of channels on a page.
+
+        Returns:
+            list: The channels on the page.
+        """
+        return self.channels[number * size : (number + 1) * size]
+
+    def find(self, text, size):
+        """
+        Find the page to jump to for a page number or a channel name.
+
+        Args:
+            text (str): A page number starting from 1, or a channel name.
+            size (int): The number of channels on a page.
+
+        Returns:
+            int: The page number starting from 0, None if nothing matches.
+        """
+        text = text.strip()
+        if text.isdigit():
+            number = int(text) - 1
+            return number if 0 <= number < self.pages(size) else None
+        index = self.indexes.get(text)
+        return None if index is None else index // size
+
+
+REGISTRY = ChannelRegistry()
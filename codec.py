@@ -0,0 +1,86 @@
+# Author: Dongli Liu
+# Description: A compact codec for frames of radio samples.
+
+import struct
+import warnings
+import zlib
+
+import numpy as np
+
+
+class FrameCodec:
+    """
+    A codec packing a frame of samples into compressed bytes.
+
+    Samples are quantized to int16 multiples of a step and delta-encoded
+    within the frame. The deltas wrap around in int16, which the cumulative
+    sum on decoding undoes exactly. The deltas are then compressed with zlib.
+    Samples beyond +/-32767 steps are clipped with a warning.
+    A frame is the magic bytes, the step as a double and the compressed body.
+
+    Attributes:
+        step (float): The quantization step of the samples.
+        level (int): The zlib compression level.
+    """
+
+    MAGIC = b"DQ"  # JSON payloads start with "{", so frames are told apart
+    HEADER = struct.Struct("<2sd")
+    LIMIT = np.iinfo(np.int16)
+
+    def __init__(self, step=0.1, level=1) -> None:
+        """
+        Initialize the FrameCodec.
+
+        Args:
+            step (float): The quantization step of the samples.
+            level (int): The zlib compression level, low is fast.
+        """
+        if step <= 0:
+            raise ValueError("step must be positive.")
+        self.step = step
+        self.level = level
+
+    def encode(self, samples):
+        """
+        Encode a frame of samples.
+
+        Args:
+            samples (numpy.ndarray): The samples of the frame.
+
+        Returns:
+            bytes: The encoded frame.
+        """
+        q = np.rint(np.asarray(samples, dtype=float) / self.step)
+        if np.any((q < self.LIMIT.min) | (q > self.LIMIT.max)):
+            warnings.warn(
+                f"Samples beyond +/-{self.LIMIT.max * self.step:g} were clipped,"
+                " use a larger step.",
+                RuntimeWarning,
+            )
+        q = np.clip(q, self.LIMIT.min, self.LIMIT.max).astype(np.int16)
+        deltas = np.diff(q, prepend=np.int16(0)).astype("<i2")
+        body = zlib.compress(deltas.tobytes(), self.level)
+        return self.HEADER.pack(self.MAGIC, self.step) + body
+
+    @classmethod
+    def decode(cls, payload):
+        """
+        Decode a frame of samples.
+
+        Args:
+            payload (bytes): The encoded frame.
+
+        Returns:
+            numpy.ndarray: The reconstructed samples.
+        """
+        magic, step = cls.HEADER.unpack_from(payload)
+        if magic != cls.MAGIC:
+            raise ValueError("payload is not an encoded frame.")
+        body = zlib.decompress(payload[cls.HEADER.size :])
+        deltas = np.frombuffer(body, dtype="<i2")
+        return deltas.cumsum(dtype=np.int16) * step
+
+    @classmethod
+    def isFrame(cls, payload):
+        """Tell if a payload is an encoded frame rather than JSON."""
+        return payload[: len(cls.MAGIC)] == cls.MAGIC
@@ -6,6 +6,7 @@ from threading import Thread
 from tkinter import *
 
 from data_generator import VoiceDataGenerator
+from raster_chart import RasterChart
 
 
 class DynamicChart(Frame):
@@ -20,13 +21,16 @@ class DynamicChart(Frame):
         margin (int): The margin around the chart.
         amplify (int): The amplification factor for the chart for better appearance.
         box (list): A list containing the current data box.
-        locs (list): A list containing the locations of the chart elements.
+        locs (numpy.ndarray): An (n, 2) array of the locations of the chart elements.
         col_range (list): A list containing the range of colors for the chart bars.
+        backend (str): The rendering backend, "canvas" items or a "raster" image.
+        raster (RasterChart): The RGB buffer used by the raster backend.
         thread (Thread): A Thread object for running the chart update loop.
     """
 
     GENERATOR = VoiceDataGenerator(duration=1000, gender="M")
     DATA = GENERATOR.data.tolist()
+    BACKENDS = ("canvas", "raster")
 
     def __init__(
         self,
@@ -39,9 +43,13 @@ class DynamicChart(Frame):
         box=None,
         base=340,
         color_range=[[255, 113, 205], [87, 85, 254]],
+        backend="canvas",
     ):
         """Initialize the DynamicChart."""
         super().__init__()
+        if backend not in DynamicChart.BACKENDS:
+            raise ValueError(f"backend must be one of {DynamicChart.BACKENDS}.")
+        self.backend = backend
         self.width = width
         self.chart_only = chart_only
         self.c_data = self.CircularList(data)
@@ -87,31 +95,88 @@ class DynamicChart(Frame):
             frame.place(relx=0.03, rely=0.03, relwidth=0.94, relheight=0.94)
         self.canvas = Canvas(frame)
         self.canvas.pack(fill=BOTH, expand=1)
+        if self.backend == "raster":
+            self.initRaster()
         self.drawBars()
         if not self.chart_only:
             self.drawLine()
         self.drawInfo(self.locs[-1][-1], topic=topic)
 
+    def initRaster(self):
+        """Create the RGB buffer and the image item of the raster backend."""
+        self.raster = RasterChart(
+            self.width * self.amplify + 2 * self.margin, self.base + 20
+        )
+        self.photo = PhotoImage(
+            master=self.canvas, width=self.raster.width, height=self.raster.height
+        )
+        self.canvas.create_image(0, 0, image=self.photo, anchor=NW)
+        self._rendered_range = None
+
     def refresh(self, topic=None):
         """Refresh the chart."""
         if self.chart_only is not True:
             while True:
                 time.sleep(self.frequency)
-                self.canvas.delete("bars")
-                self.box = self.c_data.roll(self.width)
-                self.locs = self.getLocations()
-                self.drawBars()
-                self.drawLine()
-                self.drawInfo(self.locs[-1][-1])
+                self.nextFrame()
         else:
-            self.canvas.delete("all")
+            self.canvas.delete("bars", "line", "info")
             self.locs = self.getLocations()
             self.drawBars()
             self.drawInfo(self.locs[-1][-1], topic=topic)
             # self.drawLine()
 
+    def nextFrame(self):
+        """Roll the data by one and draw the next frame."""
+        self.canvas.delete("bars", "line", "info")
+        self.box = self.c_data.roll(self.width)
+        self.locs = self.getLocations()
+        if self.backend == "raster":
+            self.scrollRaster()
+            self.blitRaster()
+        else:
+            self.drawBars()
+            self.drawLine()
+        self.drawInfo(self.locs[-1][-1])
+
+    def scrollRaster(self):
+        """Shift the raster by one bar and render only the newest columns."""
+        if (
+            self._rendered_range != self.col_range
+            or len(self.locs) < 4
+            or not float(self.amplify).is_integer()  # shift must be whole pixels
+        ):
+            self.renderRaster(line=True)
+            return
+        self.raster.scroll(self.amplify)
+        # the first segment is clamped at the edge, so both ends are rendered
+        self.renderRaster(line=True, stop=self.locs[1][0] + 1)
+        # the spline segments touching the new point are the only ones changed
+        self.renderRaster(line=True, start=self.locs[-4][0])
+
+    def renderRaster(self, line=False, start=0, stop=None):
+        """Render the current locations into the raster."""
+        self.raster.render(
+            self.locs,
+            self.base + 20,
+            self.amplify * 0.8,
+            self.col_range,
+            line=line,
+            start=start,
+            stop=stop,
+        )
+        self._rendered_range = [list(c) for c in self.col_range]
+
+    def blitRaster(self):
+        """Show the raster in the image on the canvas."""
+        self.photo.configure(data=self.raster.ppm(), format="PPM")
+
     def drawBars(self):
         """Draw the bars on the chart."""
+        if self.backend == "raster":
+            self.renderRaster(line=not self.chart_only)
+            self.blitRaster()
+            return
 
         def getColor(pitch):
             # generate a color corresponding to the pitch
@@ -135,14 +200,19 @@ class DynamicChart(Frame):
 
     def drawLine(self):
         """Draw the line on the chart."""
-        self.canvas.create_line(self.locs, width=2, smooth=True)
+        if self.backend == "raster":
+            return  # the line is rendered together with the bars
+        self.canvas.create_line(
+            self.locs.ravel().tolist(), width=2, smooth=True, tags="line"
+        )
 
-    def drawInfo(self, pitch, topic):
+    def drawInfo(self, pitch, topic=None):
         """
         Draw the information text on the chart.
 
         Args:
             pitch (int): The pitch value.
+            topic (str): The channel playing, shown when chart only.
         """
         if not self.chart_only:
             msg = (
@@ -153,31 +223,36 @@ class DynamicChart(Frame):
                     if self.base - pitch > 60
                     else "is in silence. Noise: "
                 )
-                + str(self.base - pitch)
+                + str(round(self.base - pitch))
             )
         else:
             topic = topic.capitalize() if topic is not None else "No Channel"
             msg = f" {topic} is playing..."
-        self.canvas.create_text(self.margin / 2, self.base + 30, text=msg, anchor=W)
+        self.canvas.create_text(
+            self.margin / 2, self.base + 30, text=msg, anchor=W, tags="info"
+        )
 
     def getLocations(self):
         """Calculate the locations of the chart elements."""
-        locations = []
-        offset = self.box[0][0]
-        for i in range(self.width):
-            x = (self.box[i][0] - offset) * self.amplify + self.margin
-            y = self.base - round(self.box[i][1])
-            locations.append([x, y])
-        return locations
+        box = np.asarray(self.box, dtype=float)
+        return np.column_stack(
+            (
+                np.arange(len(box)) * self.amplify + self.margin,
+                self.base - np.rint(box[:, 1]),
+            )
+        )
 
     class CircularList:
         """
-        A class representing a circular list.
+        A class representing a circular list backed by a NumPy array.
+
+        The data is stored twice back to back, so any window no longer than
+        the data itself is a contiguous slice and can be returned as a view.
 
         Attributes:
-            l (list): The list data.
+            l (numpy.ndarray): The doubled array data.
             c (int): The current index cursor.
-            n (int): The length of the list.
+            n (int): The length of the original data.
         """
 
         def __init__(self, data):
@@ -185,21 +260,21 @@ class DynamicChart(Frame):
             Initialize the CircularList.
 
             Args:
-                data (list): The initial list data.
+                data (list | numpy.ndarray): The initial list data.
             """
-            if isinstance(data, list):
-                self.l = data
-            else:
-                raise ValueError("l must be a list.")
+            if not isinstance(data, (list, np.ndarray)):
+                raise ValueError("l must be a list or a numpy array.")
+            data = np.asarray(data, dtype=float)
+            if data.shape[0] == 0:
+                raise ValueError("l must not be empty.")
+            self.l = np.concatenate((data, data))
             self.c = 0
-            self.n = len(self.l)
+            self.n = data.shape[0]
 
         def walk(self):
             """Move the cursor and return the element."""
             e = self.l[self.c]
-            self.c += 1
-            if self.c == self.n - 1:
-                self.c = 0
+            self.c = (self.c + 1) % self.n
             return e
 
         def roll(self, wid):
@@ -210,13 +285,16 @@ class DynamicChart(Frame):
                 wid (int): The width of the box.
 
             Returns:
-                list: A list containing the box of data.
+                numpy.ndarray: A view of the box of data, or a copy if the
+                width is larger than the data.
             """
-            tmp = self.c  # current cursor
-            es = [self.walk() for _ in range(wid)]  # create a list in width
-            self.c = tmp  # reset cursor to previous and walk to next
-            self.walk()
-            return es
+            start = self.c
+            self.c = (self.c + 1) % self.n  # walk to next for the next frame
+            if wid <= self.n:
+                return self.l[start : start + wid]
+            return np.take(
+                self.l[: self.n], np.arange(start, start + wid), axis=0, mode="wrap"
+            )
 
 
 def hexColor(rgb):
@@ -1,9 +1,12 @@
 import paho.mqtt.client as mqtt
 from json import loads
-from tkinter import Frame, BOTH, Button, Tk
+from tkinter import Frame, BOTH, Button, Entry, Label, Tk
 from threading import Thread
-from util import HOST, PORT, CHANNELS, COLORS
+from util import HOST, PORT, PAGE_SIZE
+from channels import REGISTRY
+from codec import FrameCodec
 from dynamic_chart import DynamicChart
+from waterfall import Waterfall
 
 
 class Radio(Frame):
@@ -12,28 +15,35 @@ class Radio(Frame):
 
     Attributes:
         chart_wid (int): The width of the chart.
-        data (list): A list containing the radio data.
+        data (list): A list containing the radio data of the current channel.
+        buffers (dict): The radio data of each channel received, by topic.
         buttons (list): A list containing radio button widgets.
-        count (int): The count of radio data.
+        page_size (int): The number of channel buttons on a page.
+        page (int): The current page of channel buttons.
         chart (DynamicChart): An DynamicChart widget for displaying radio data.
-        fms (list): A list containing the frequency modulations.
+        waterfall (Waterfall): A Waterfall widget for displaying the radio history.
+        view (str): The view shown on the right, "chart" or "waterfall".
+        fms (list): A list containing the frequency modulations on the page.
         receiver (Receiver): An Receiver instance for receiving radio signals.
         receiver_thread (Thread): A thread for running the receiver process.
     """
 
-    def __init__(self, chart_wid=100):
+    def __init__(self, chart_wid=100, page_size=PAGE_SIZE):
         """Initialize the Radio."""
         super().__init__()
         self.chart_wid = chart_wid
-        self.data = [[i, 10] for i in range(self.chart_wid)]
+        self.buffers = {}
         self.buttons = []
-        self.count = len(self.data)
+        self.page_size = page_size
+        self.page = 0
+        self.view = "chart"
         self.initReceiver()
+        self.data = [[i, 10] for i in range(self.chart_wid)]  # nothing received
         self.initUI()
 
     def initReceiver(self):
         """Initialize the radio receiver."""
-        self.fms = [i for i in range(4)]
+        self.fms = [c.index for c in REGISTRY.page(self.page, self.page_size)]
         self.receiver = Receiver()
         self.receiver.client.on_message = self.process
         self.receiver_thread = Thread(target=self.receiver.block, daemon=True)
@@ -52,59 +62,132 @@ class Radio(Frame):
             base=340,
             color_range=self.receiver.theme,
         )
+        self.waterfall = Waterfall(self)
         self.drawLeft()
         self.drawRight()
 
     def process(self, client, user_data, message):
         """Process incoming radio messages."""
-        decoded_msg = message.payload.decode("utf-8")
-        message_dict = loads(decoded_msg)
-        for _, v in message_dict.items():
-            self.data.append([self.count, v])
-            self.data.pop(0)
-            self.count += 1
+        if FrameCodec.isFrame(message.payload):
+            values = FrameCodec.decode(message.payload).tolist()
+        else:
+            decoded_msg = message.payload.decode("utf-8")
+            values = list(loads(decoded_msg).values())
+        data = self.channelData(message.topic)
+        count = data[-1][0] + 1
+        data.extend([count + i, v] for i, v in enumerate(values))
+        del data[: len(data) - self.chart_wid]
+        if message.topic != self.receiver.topic:
+            return  # late message of the channel switched from
+        for v in values:  # one row per sample, however they were framed
+            self.waterfall.push([v], self.receiver.theme)
         self.update_ui()
 
+    def channelData(self, topic):
+        """Return the radio data of a channel, creating it on first use."""
+        if topic not in self.buffers:
+            self.buffers[topic] = [[i, 10] for i in range(self.chart_wid)]
+        return self.buffers[topic]
+
     def drawLeft(self):
         """Draw the left section of the radio interface."""
         self.console = Frame(self)
         self.console.place(relx=0.03, rely=0.03, relwidth=0.2, relheight=0.94)
-        self.drawBtns(init=True)
+        self.drawBtns()
+        self.drawPager()
 
     def drawRight(self):
         """Draw the right section of the radio interface."""
+        self.view_btn = Button(self, text="Waterfall", command=self.switchView)
+        self.view_btn.place(relx=0.28, rely=0.02, relwidth=0.12, relheight=0.06)
         self.chart.place(relx=0.28, rely=0.1, relwidth=0.76, relheight=0.94)
         self.drawChart()
 
-    def drawBtns(self, init=False):
+    def drawBtns(self):
         """Draw the radio buttons."""
         for btn in self.buttons:
             btn.destroy()
         self.buttons = []
         for i, fm in enumerate(self.fms):
-            receiving = fm == self.receiver.fm if not init else False
+            receiving = fm == self.receiver.fm
             btn = Button(
                 self.console,
                 bg="orange" if receiving else "#f0f0f0",
-                text=CHANNELS[fm],
+                text=REGISTRY[fm].name,
                 borderwidth=2,
                 font=("Helvetica", 18),
                 relief="groove" if receiving else "raised",
                 fg="white" if receiving else "black",
                 command=lambda fm=fm: self.switchFm(fm),
             )
-            btn.place(relx=0.03, rely=0.03 + i * 0.23, relwidth=0.8, relheight=0.2)
+            btn.place(
+                relx=0.03,
+                rely=0.03 + i * 0.75 / self.page_size,
+                relwidth=0.8,
+                relheight=0.65 / self.page_size,
+            )
             self.buttons.append(btn)
 
+    def drawPager(self):
+        """Draw the buttons for switching pages and the entry to jump to one."""
+        if REGISTRY.pages(self.page_size) == 1:
+            return
+        self.find_entry = Entry(self.console)  # page number or channel name
+        self.find_entry.bind("<Return>", lambda e: self.findPage())
+        self.find_entry.place(relx=0.03, rely=0.77, relwidth=0.8, relheight=0.07)
+        prev_btn = Button(self.console, text="<", command=lambda: self.switchPage(-1))
+        prev_btn.place(relx=0.03, rely=0.86, relwidth=0.2, relheight=0.08)
+        self.page_label = Label(self.console)
+        self.page_label.place(relx=0.23, rely=0.86, relwidth=0.4, relheight=0.08)
+        next_btn = Button(self.console, text=">", command=lambda: self.switchPage(1))
+        next_btn.place(relx=0.63, rely=0.86, relwidth=0.2, relheight=0.08)
+        self.showPage(0)
+
+    def switchPage(self, step):
+        """Move a number of pages of channels forwards or backwards."""
+        self.showPage(self.page + step)
+
+    def findPage(self):
+        """Jump to the page number or the page of the channel entered."""
+        page = REGISTRY.find(self.find_entry.get(), self.page_size)
+        if page is None:
+            self.find_entry.config(bg="pink")  # nothing matched
+            return
+        self.find_entry.config(bg="white")
+        self.showPage(page)
+
+    def showPage(self, page):
+        """Show a page of channel buttons."""
+        pages = REGISTRY.pages(self.page_size)
+        self.page = page % pages
+        self.page_label.config(text=f"{self.page + 1} / {pages}")
+        self.fms = [c.index for c in REGISTRY.page(self.page, self.page_size)]
+        self.drawBtns()
+
     def drawChart(self):
         """Draw the radio chart."""
         self.chart.box = self.data
         self.chart.locs = self.chart.getLocations()
         self.chart.drawChart()
 
+    def switchView(self):
+        """Switch between the chart and the waterfall view."""
+        if self.view == "chart":
+            self.view = "waterfall"
+            self.chart.place_forget()
+            self.waterfall.place(relx=0.28, rely=0.1)  # at its own fixed size
+            self.view_btn.config(text="Chart")
+        else:
+            self.view = "chart"
+            self.waterfall.place_forget()
+            self.chart.place(relx=0.28, rely=0.1, relwidth=0.76, relheight=0.94)
+            self.view_btn.config(text="Waterfall")
+
     def switchFm(self, fm):
         """Switch the radio frequency modulation."""
         self.receiver.switch(fm)
+        self.data = self.channelData(self.receiver.topic)
+        self.waterfall.clear()
         self.drawBtns()
 
     def update_ui(self):
@@ -119,27 +202,28 @@ class Receiver:
     A class representing a radio signal receiver.
 
     Attributes:
-        fm (int): The frequency modulation index.
-        topic (str): The current radio channel topic.
+        fm (int): The frequency modulation index, None until a channel is chosen.
+        topic (str): The current radio channel topic, None until subscribed.
         theme (list): The color theme for the radio chart.
         client (mqtt.Client): An instance of the MQTT client for receiving radio signals.
     """
 
-    def __init__(self, fm=0) -> None:
-        """Initialize the radio receiver."""
-        self.fm = fm
-        self.topic = CHANNELS[self.fm]
-        self.theme = COLORS[self.topic]
+    def __init__(self) -> None:
+        """Initialize the radio receiver, not subscribed to any channel."""
+        self.fm = None
+        self.topic = None
+        self.theme = REGISTRY[0].colors
         self.client = mqtt.Client()
         self.client.connect(HOST, PORT)
 
     def switch(self, fm):
         """Switch the radio channel."""
-        old_topic = CHANNELS[self.fm]
+        old_topic = self.topic
         self.fm = fm
-        self.topic = CHANNELS[self.fm]
-        self.theme = COLORS[self.topic]
-        self.client.unsubscribe(old_topic)
+        self.topic = REGISTRY[self.fm].name
+        self.theme = REGISTRY[self.fm].colors
+        if old_topic is not None:
+            self.client.unsubscribe(old_topic)
         self.client.subscribe(self.topic)
 
     def block(self):
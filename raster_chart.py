@@ -0,0 +1,130 @@
+# Author: Dongli Liu
+# Description: A class to rasterize chart bars and line into an RGB buffer.
+
+import numpy as np
+
+
+class RasterChart:
+    """
+    A class rasterizing the bars and the smoothed line of a chart.
+
+    The whole chart lives in one RGB buffer which is blitted as a single
+    image, so the cost of a frame does not depend on the number of canvas
+    items. Scrolling shifts the buffer and only renders the newest columns.
+
+    Attributes:
+        width (int): The width of the buffer in pixels.
+        height (int): The height of the buffer in pixels.
+        background (numpy.ndarray): The background RGB color.
+        line_color (numpy.ndarray): The RGB color of the line.
+        buf (numpy.ndarray): The (height, width, 3) RGB buffer.
+        rows (numpy.ndarray): A column vector of the row indices.
+    """
+
+    def __init__(
+        self, width, height, background=(240, 240, 240), line_color=(0, 0, 0)
+    ):
+        """
+        Initialize the RasterChart.
+
+        Args:
+            width (int): The width of the buffer in pixels.
+            height (int): The height of the buffer in pixels.
+            background (tuple): The background RGB color.
+            line_color (tuple): The RGB color of the line.
+        """
+        self.width = int(width)
+        self.height = int(height)
+        self.background = np.array(background, dtype=np.uint8)
+        self.line_color = np.array(line_color, dtype=np.uint8)
+        self.buf = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self.buf[...] = self.background
+        self.rows = np.arange(self.height)[:, None]
+
+    def render(
+        self, locs, bottom, bar_width, col_range, line=True, start=0, stop=None
+    ):
+        """
+        Render the bars and the line into a range of columns of the buffer.
+
+        Args:
+            locs (numpy.ndarray): An (n, 2) array of evenly spaced bar locations.
+            bottom (int): The row where the bars end.
+            bar_width (float): The width of each bar in pixels.
+            col_range (list): The two RGB colors the bar colors are mixed from.
+            line (bool): Draw the smoothed line through the bar tops.
+            start (int): The first column to render.
+            stop (int): The column to stop before, the right edge if None.
+        """
+        stop = self.width if stop is None else max(0, min(int(stop), self.width))
+        start = max(0, min(int(start), stop))
+        if start == stop:
+            return
+        x, y = locs[:, 0], locs[:, 1]
+        n = len(x)
+        step = x[1] - x[0] if n > 1 else 1
+        px = np.arange(start, stop)
+
+        # bars: every column belongs to the nearest bar if inside its width
+        i = np.clip(np.rint((px - x[0]) / step).astype(int), 0, n - 1)
+        covered = (px >= x[i] - bar_width / 2) & (px < x[i] + bar_width / 2)
+        bars = covered & (self.rows >= np.rint(y[i])) & (self.rows < bottom)
+        low, high = (np.array(c, dtype=float) for c in col_range)
+        colors = np.clip(low + (high - low) * y[i, None] / 255, 0, 255)
+        region = np.where(bars[..., None], colors.astype(np.uint8), self.background)
+
+        if line and n > 1:
+            # join each column to the previous one to keep steep slopes solid
+            ly = self._spline(x, y, step, np.arange(start - 1, stop))
+            lo = np.minimum(ly[:-1], ly[1:])
+            hi = np.maximum(ly[:-1], ly[1:])
+            inside = (px >= x[0]) & (px <= x[-1])
+            lines = inside & (self.rows >= lo - 1) & (self.rows <= hi)
+            region[lines] = self.line_color
+
+        self.buf[:, start:stop] = region
+
+    def scroll(self, step):
+        """
+        Shift the buffer to the left, leaving stale columns on the right.
+
+        Args:
+            step (int): The number of pixels to shift.
+        """
+        step = int(step)
+        if 0 < step < self.width:
+            self.buf[:, :-step] = self.buf[:, step:]
+
+    def ppm(self):
+        """Return the buffer encoded as binary PPM data."""
+        header = f"P6 {self.width} {self.height} 255 ".encode()
+        return header + self.buf.tobytes()
+
+    def _spline(self, x, y, step, px):
+        """
+        Evaluate the Catmull-Rom spline through the points at given columns.
+
+        Args:
+            x (numpy.ndarray): The evenly spaced x coordinates of the points.
+            y (numpy.ndarray): The y coordinates of the points.
+            step (float): The spacing between the points.
+            px (numpy.ndarray): The columns to evaluate.
+
+        Returns:
+            numpy.ndarray: The rounded rows of the spline at each column.
+        """
+        n = len(x)
+        f = (px - x[0]) / step
+        j = np.clip(np.floor(f).astype(int), 0, n - 2)
+        t = np.clip(f - j, 0, 1)
+        p0 = y[np.maximum(j - 1, 0)]
+        p1 = y[j]
+        p2 = y[j + 1]
+        p3 = y[np.minimum(j + 2, n - 1)]
+        ly = 0.5 * (
+            2 * p1
+            + (p2 - p0) * t
+            + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t**2
+            + (3 * p1 - p0 - 3 * p2 + p3) * t**3
+        )
+        return np.rint(ly)
@@ -2,68 +2,121 @@
 # Description: A class to simulate a transmitter console.
 
 import paho.mqtt.client as mqtt
+import numpy as np
 
-from queue import Queue
+from math import ceil, sqrt
 from time import asctime, sleep
 from json import dumps
-from threading import Thread
-from tkinter import Frame, BOTH, Button, Tk
+from threading import Thread, Event
+from tkinter import Frame, BOTH, Button, Entry, Label, Tk
 
+from channels import REGISTRY
+from codec import FrameCodec
 from data_generator import VoiceDataGenerator
-from util import HOST, PORT, CHANNELS, METRICS
+from util import HOST, PORT, PAGE_SIZE, CODEC_STEP, FRAME_SIZE
 
 
 class Console(Frame):
     """GUI class for managing transmitter buttons."""
 
-    def __init__(self):
+    def __init__(self, page_size=PAGE_SIZE):
         """Initialize Console."""
         super().__init__()
-        self.buttons = Queue(maxsize=4)  # Queue for storing buttons
+        self.page_size = page_size  # Number of buttons on a page
+        self.page = 0  # Current page
+        self.buttons = []  # Buttons on the current page
         self.initTransmitters()  # Initialize transmitters
         self.initUI()  # Initialize GUI
 
     def initTransmitters(self):
         """Initialize transmitters."""
-        # Create transmitter objects
-        self.transmitters = [Transmitter(bond=i) for i in range(4)]
+        # Transmitter objects are created on first use, keyed by bond
+        self.transmitters = {}
+
+    def getTransmitter(self, bond):
+        """Return the transmitter of a channel, creating it on first use."""
+        if bond not in self.transmitters:
+            self.transmitters[bond] = Transmitter(bond=bond)
+        return self.transmitters[bond]
 
     def initUI(self):
         """Initialize GUI."""
         self.master.title("Transmitter Console")
         self.pack(fill=BOTH, expand=1)
+        self.stage = Frame(self)
+        self.stage.place(relx=0.1, rely=0.1, relwidth=0.8, relheight=0.8)
         self.drawCenter()
+        self.drawPager()
 
     def drawCenter(self):
-        """Draw transmitter buttons."""
-        self.stage = Frame(self)
-        self.stage.place(relx=0.1, rely=0.1, relwidth=0.8, relheight=0.8)
-        t = 0
-        for i in range(2):
-            for j in range(2):
-                transmitter = self.transmitters[t]
-                btn = self.createTransmitterBtn(self.stage, transmitter)
-                btn.place(
-                    relx=0.03 + i * 0.5,
-                    rely=0.03 + j * 0.5,
-                    relwidth=0.45,
-                    relheight=0.45,
-                )
-                self.buttons.put(btn)
-                t += 1
-
-    def createTransmitterBtn(self, frame, transmitter):
+        """Draw transmitter buttons of the current page."""
+        for btn in self.buttons:
+            btn.destroy()
+        self.buttons = []
+        cols = ceil(sqrt(self.page_size))
+        rows = ceil(self.page_size / cols)
+        for t, channel in enumerate(REGISTRY.page(self.page, self.page_size)):
+            i, j = divmod(t, rows)
+            btn = self.createTransmitterBtn(self.stage, channel.index)
+            btn.place(
+                relx=0.03 + i / cols,
+                rely=0.03 + j / rows,
+                relwidth=0.9 / cols,
+                relheight=0.9 / rows,
+            )
+            self.buttons.append(btn)
+
+    def drawPager(self):
+        """Draw the buttons for switching pages and the entry to jump to one."""
+        if REGISTRY.pages(self.page_size) == 1:
+            return
+        prev_btn = Button(self, text="<", command=lambda: self.switchPage(-1))
+        prev_btn.place(relx=0.1, rely=0.9, relwidth=0.1, relheight=0.08)
+        self.find_entry = Entry(self)  # page number or channel name
+        self.find_entry.bind("<Return>", lambda e: self.findPage())
+        self.find_entry.place(relx=0.22, rely=0.9, relwidth=0.32, relheight=0.08)
+        self.page_label = Label(self)
+        self.page_label.place(relx=0.56, rely=0.9, relwidth=0.22, relheight=0.08)
+        next_btn = Button(self, text=">", command=lambda: self.switchPage(1))
+        next_btn.place(relx=0.8, rely=0.9, relwidth=0.1, relheight=0.08)
+        self.showPage(0)
+
+    def switchPage(self, step):
+        """Move a number of pages forwards or backwards."""
+        self.showPage(self.page + step)
+
+    def findPage(self):
+        """Jump to the page number or the page of the channel entered."""
+        page = REGISTRY.find(self.find_entry.get(), self.page_size)
+        if page is None:
+            self.find_entry.config(bg="pink")  # Nothing matched
+            return
+        self.find_entry.config(bg="white")
+        self.showPage(page)
+
+    def showPage(self, page):
+        """Show a page of transmitter buttons."""
+        pages = REGISTRY.pages(self.page_size)
+        self.page = page % pages
+        self.page_label.config(text=f"{self.page + 1} / {pages}")
+        self.drawCenter()
+
+    def createTransmitterBtn(self, frame, bond):
         """Create a transmitter button."""
+        transmitter = self.transmitters.get(bond)
+        playing = transmitter is not None and transmitter.playing
         btn = Button(
             frame,
-            bg="#f0f0f0" if not transmitter.playing else "orange",
-            text=transmitter.topic,
+            bg="#f0f0f0" if not playing else "orange",
+            text=REGISTRY[bond].name,
             borderwidth=2,
             font=("Helvetica", 24, "italic"),
-            relief="raised" if not transmitter.playing else "groove",
-            fg="black" if not transmitter.playing else "white",
+            relief="raised" if not playing else "groove",
+            fg="black" if not playing else "white",
+        )
+        btn.config(
+            command=lambda: self.switchTransmitter(btn, self.getTransmitter(bond))
         )
-        btn.config(command=lambda: self.switchTransmitter(btn, transmitter))
         return btn
 
     def switchTransmitter(self, btn, transmitter, switch=True):
@@ -88,23 +141,30 @@ class Transmitter:
         self,
         bond=0,
         delay=0.3,
+        codec_step=CODEC_STEP,
+        frame_size=FRAME_SIZE,
     ) -> None:
         """Initialize transmitter."""
         self.bond = bond  # Transmitter bond
-        self.topic = CHANNELS[self.bond]  # Transmitter topic
+        self.topic = REGISTRY[self.bond].name  # Transmitter topic
         self.playing = False  # Transmitter playing status
         self.connected = False  # Transmitter connection status
-        self.delay = delay  # Transmission delay
-        self.cursor = 0  # Cursor position
+        self.delay = delay  # Transmission delay per sample
+        self.codec = (
+            FrameCodec(step=codec_step) if codec_step is not None else None
+        )  # Frame codec, JSON is sent if None
+        self.frame_size = frame_size  # Samples per encoded frame
         self.t = Thread(
             target=self.transmit, args=(), daemon=True
         )  # Transmission thread
-        self.data = Queue()  # Data queue
         self.client = mqtt.Client()  # MQTT client
         self.client.on_connect = self.on_connect
         self.client.on_disconnect = self.on_disconnect
         self.client.on_publish = self.on_publish
         self.tune()  # Tune transmitter parameters
+        self.cursor = BlockCursor(
+            self.generator.data[:, 1], self.process
+        )  # Cursor over data blocks
 
     def play(self):
         """Start transmitter."""
@@ -132,22 +192,33 @@ class Transmitter:
 
     def tune(self):
         """Set transmitter parameters."""
-        self.generator = VoiceDataGenerator(*METRICS[self.bond])
+        self.generator = VoiceDataGenerator(*REGISTRY[self.bond].metrics)
 
     def process(self):
-        """Process data."""
-        raw = self.generator.data
-        for i in range(raw.shape[0]):
-            self.data.put(raw[i, 1])
+        """Generate the next block of data."""
+        self.tune()
+        return self.generator.data[:, 1]
 
     def transmit(self):
         """Transmit data."""
         while True:
             if not self.playing:
                 continue  # Skip the rest and continue the loop if not playing
-            if self.data.empty():
-                self.process()
-            syllable = {asctime(): self.data.get()}
+            try:
+                if self.codec is not None:
+                    samples = self.cursor.take(self.frame_size)
+                else:
+                    sample = self.cursor.next()
+            except Exception as e:  # Refill failed, the cursor prefetches again
+                print(f"Channel {self.topic} failed to refill data: {e!r}")
+                sleep(self.delay)
+                continue
+            if self.codec is not None:
+                payload = self.codec.encode(samples)  # Compress the frame
+                self.client.publish(topic=self.topic, payload=payload)
+                sleep(self.delay * len(samples))
+                continue
+            syllable = {asctime(): sample}
             payload = dumps(syllable)  # Serialize syllable to JSON
             self.client.publish(topic=self.topic, payload=payload)
             sleep(self.delay)
@@ -167,6 +238,81 @@ class Transmitter:
         self.connected = False
 
 
+class BlockCursor:
+    """
+    Cursor over contiguous blocks of samples.
+
+    Samples are handed out as views of the current block, so taking one is
+    an index bump. The next block is produced in the background as soon as
+    the current one is taken into use, so a refill never stalls the reader.
+    """
+
+    def __init__(self, block, produce) -> None:
+        """
+        Initialize the cursor.
+
+        Args:
+            block (numpy.ndarray): The first block of samples.
+            produce (callable): Returns the next block of samples when called.
+        """
+        self.produce = produce  # Producer of the next block
+        self.block = np.ascontiguousarray(block)  # Current block
+        self.pos = 0  # Position in the current block
+        self.pending = None  # Prefetched block
+        self.error = None  # Exception raised while prefetching
+        self.ready = Event()  # Set when the prefetched block is ready
+        self.prefetch()
+
+    def prefetch(self):
+        """Start producing the next block in the background."""
+        self.ready.clear()
+        Thread(target=self.fill, daemon=True).start()
+
+    def fill(self):
+        """Produce the next block, keeping any error for the reader."""
+        try:
+            self.pending = np.ascontiguousarray(self.produce())
+        except Exception as e:
+            self.error = e
+        finally:
+            self.ready.set()
+
+    def swap(self):
+        """Move to the prefetched block and start prefetching the one after."""
+        self.ready.wait()
+        if self.error is not None:
+            error, self.error = self.error, None
+            self.prefetch()  # try again on the next swap
+            raise error
+        self.block, self.pending = self.pending, None
+        self.pos = 0
+        self.prefetch()
+
+    def take(self, n):
+        """
+        Take up to n samples from the current block without copying.
+
+        Args:
+            n (int): The maximum number of samples.
+
+        Returns:
+            numpy.ndarray: A view of the samples, shorter at the end of a block.
+        """
+        if self.pos >= self.block.shape[0]:
+            self.swap()
+        view = self.block[self.pos : self.pos + n]
+        self.pos += view.shape[0]
+        return view
+
+    def next(self):
+        """Take the next sample."""
+        if self.pos >= self.block.shape[0]:
+            self.swap()
+        sample = self.block[self.pos]
+        self.pos += 1
+        return sample
+
+
 if __name__ == "__main__":
     root = Tk()
     root.geometry("320x320+300+300")
@@ -1,15 +1,12 @@
+import os
+
 HOST = "localhost"
 PORT = 1883
-CHANNELS = ["news", "talk", "story", "sport"]
-METRICS = [  # representing the parameters for creating data generators
-    [200, "M", 20, -20, -10],
-    [300, "F", 50, 0, 0],
-    [1000, "F", 10, -25, -10],
-    [500, "M", 100, 20, 10],
-]
-COLORS = {  # representing the color ranges of channels in chart
-    "news": [[255, 113, 205], [87, 85, 254]],
-    "talk": [[100, 200, 50], [200, 100, 50]],
-    "story": [[50, 150, 200], [200, 150, 50]],
-    "sport": [[200, 50, 50], [50, 200, 50]],
-}
+CONFIG = os.path.join(  # the channel registry, see channels.py
+    os.path.dirname(os.path.abspath(__file__)), "channels.json"
+)
+PAGE_SIZE = 4  # channels shown at once in the transmitter console and radio
+# quantization step of compressed frames, None sends JSON; samples must stay
+# within +/-32767 steps (+/-3276.7 at 0.1) or they are clipped with a warning
+CODEC_STEP = None
+FRAME_SIZE = 10  # samples per compressed frame
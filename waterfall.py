@@ -0,0 +1,119 @@
+# Author: Dongli Liu
+# Description: A widget showing the recent pitch history of a channel.
+
+import numpy as np
+
+from tkinter import Frame, Canvas, PhotoImage, NW
+
+from dynamic_chart import hexColor
+
+
+class Waterfall(Frame):
+    """
+    A widget showing the recent history of a channel as a scrolling image.
+
+    Every update writes one row of pitch intensities into a preallocated
+    rolling buffer and the same row into the image, so the cost of an
+    update is O(row) whatever the length of the history. The image is shown
+    twice, one above the other, and the two copies are moved so the oldest
+    row is always at the top and the newest row at the bottom.
+
+    Attributes:
+        history (int): The number of rows kept, one per update.
+        bins (int): The number of pitch bins in a row.
+        spread (float): The standard deviation of a sample across the bins.
+        background (list): The RGB color of silent bins.
+        centers (numpy.ndarray): The pitch at the center of each bin.
+        levels (numpy.ndarray): The (history, bins) rolling buffer of intensities.
+        head (int): The row the next update is written to.
+        photo (PhotoImage): The image holding the rows.
+        canvas (Canvas): The canvas showing the two copies of the image.
+        top (int): The canvas item of the copy holding the oldest rows.
+        bottom (int): The canvas item of the copy holding the newest rows.
+    """
+
+    def __init__(
+        self,
+        master=None,
+        history=400,
+        bins=400,
+        pitch_range=(-100, 400),
+        spread=4,
+        background=[240, 240, 240],
+    ):
+        """Initialize the Waterfall."""
+        super().__init__(master)
+        self.history = history
+        self.bins = bins
+        self.spread = spread
+        self.background = background
+        low, high = pitch_range
+        step = (high - low) / bins
+        self.centers = low + step * (np.arange(bins) + 0.5)
+        self.levels = np.zeros((history, bins), dtype=np.uint8)
+        self.head = 0
+        self._palettes = {}
+        self.initUI()
+
+    def initUI(self):
+        """Initialize the image and the canvas."""
+        self.photo = PhotoImage(master=self, width=self.bins, height=self.history)
+        # sized to the history, a larger canvas would show the wrapped rows
+        self.canvas = Canvas(
+            self, width=self.bins, height=self.history, highlightthickness=0
+        )
+        self.canvas.pack()
+        self.top = self.canvas.create_image(0, 0, image=self.photo, anchor=NW)
+        self.bottom = self.canvas.create_image(
+            0, self.history, image=self.photo, anchor=NW
+        )
+        self.clear()
+
+    def clear(self):
+        """Forget the history, e.g. when another channel is received."""
+        self.levels[...] = 0
+        self.head = 0
+        self.photo.put(
+            hexColor(self.background), to=(0, 0, self.bins, self.history)
+        )
+        self.canvas.coords(self.top, 0, 0)
+        self.canvas.coords(self.bottom, 0, self.history)
+
+    def push(self, values, theme):
+        """
+        Add a row for the samples received in one update.
+
+        Args:
+            values (list): The pitch samples of the update.
+            theme (list): The two RGB colors the row is colored between.
+        """
+        values = np.asarray(values, dtype=float).reshape(-1, 1)
+        distance = (self.centers - values) / self.spread
+        row = np.exp(-0.5 * distance**2).max(axis=0)
+        self.levels[self.head] = np.rint(row * 255)
+        colors = self.palette(theme)[self.levels[self.head]]
+        self.photo.put("{" + " ".join(colors) + "}", to=(0, self.head))
+        self.head = (self.head + 1) % self.history
+        # rows from head are the oldest, so they go on top
+        self.canvas.coords(self.top, 0, -self.head)
+        self.canvas.coords(self.bottom, 0, self.history - self.head)
+
+    def palette(self, theme):
+        """
+        Return the hex colors of the 256 intensity levels of a theme.
+
+        Args:
+            theme (list): The two RGB colors of the channel.
+
+        Returns:
+            numpy.ndarray: The hex color of each level.
+        """
+        key = tuple(map(tuple, theme))
+        if key not in self._palettes:
+            a = np.linspace(0, 1, 256)[:, None]
+            low, high = np.array(theme[0], float), np.array(theme[1], float)
+            rgb = (1 - a) * np.array(self.background, float) + a * (
+                low + (high - low) * a
+            )
+            self._palettes[key] = np.array([hexColor(c) for c in rgb])
+        return self._palettes[key]